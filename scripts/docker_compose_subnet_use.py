@@ -1,8 +1,14 @@
 import yaml
 
+# Prefer the libyaml bindings; fall back to the pure-Python implementation
+try:
+    from yaml import CSafeLoader as Loader, CSafeDumper as Dumper
+except ImportError:
+    from yaml import SafeLoader as Loader, SafeDumper as Dumper
+
 # Load the existing docker-compose.yml file
 with open('docker-compose.yml', 'r') as file:
-    compose_data = yaml.safe_load(file)
+    compose_data = yaml.load(file, Loader=Loader)
 
 # Define the network configuration
 network_config = {
@@ -30,6 +36,6 @@ for service_name in compose_data['services']:
 
 # Write the updated compose data back to the file
 with open('docker-compose.yml', 'w') as file:
-    yaml.dump(compose_data, file)
+    yaml.dump(compose_data, file, Dumper=Dumper)
 
 print("docker-compose.yml file updated successfully.")